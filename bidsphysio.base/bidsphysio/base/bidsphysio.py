@@ -42,9 +42,13 @@ SOFTWARE.
 """
 
 import json
+import re
 
 import numpy as np
 
+# '_physio', '_bold', '.nii' and/or '.gz' (in that order), **at the end of a bidsPrefix**:
+_SUFFIX_RE = re.compile(r'(?:_physio)?(?:_bold)?(?:\.nii)?(?:\.gz)?$')
+
 
 class PhysioSignal(object):
     """
@@ -67,8 +71,9 @@ class PhysioSignal(object):
         Start time in seconds of the corresponding neural recording
         (MRI, EEG, etc.)
         Uses the same clock as 'physiostarttime'
-    signal : list of numbers
-        The physiological signal proper
+    signal : list or np.ndarray of numbers
+        The physiological signal proper. It is stored as passed (no copy is
+        made), so it can be a numpy array already prepared by the caller
     t_start : number
         BIDS definition: Start time in seconds in relation to the start
         of acquisition of the first data sample in the corresponding neural
@@ -251,10 +256,9 @@ class PhysioData(object):
         """
 
         # remove '_bold.nii(.gz)' or '_physio' if present **at the end of the bidsPrefix**
-        # (This is a little convoluted, but we make sure we don't delete it if
+        # (The regex is anchored at the end, so we make sure we don't delete it if
         #  it happens in the middle of the string)
-        for mystr in ['.gz', '.nii', '_bold', '_physio']:
-            bidsPrefix = bidsPrefix[:-len(mystr)] if bidsPrefix.endswith(mystr) else bidsPrefix
+        bidsPrefix = _SUFFIX_RE.sub('', bidsPrefix, count=1)
 
         # Whatever is left, we assign to the bidsPrefix class attribute:
         self.bidsPrefix = bidsPrefix
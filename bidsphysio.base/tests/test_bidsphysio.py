@@ -62,6 +62,17 @@ def trigger_timing(scope="module"):
     return trigger_timing
 
 
+def test_physiosignal_signal_not_copied():
+    """
+    Test that a numpy array passed as the signal of a PhysioSignal is
+    stored as is (without a copy)
+    """
+    signal = np.zeros(PHYSIO_SAMPLES_COUNT, dtype=np.float32)
+    physiosignal = PhysioSignal(label='simulated', signal=signal)
+    assert physiosignal.signal is signal
+    assert physiosignal.samples_count == PHYSIO_SAMPLES_COUNT
+
+
 def test_calculate_timing(
         mySignal
 ):
@@ -298,6 +309,17 @@ def test_append_signal(
     assert physdata.labels() == mylabels
 
 
+def test_set_bidsPrefix():
+    """
+    Tests that "set_bidsPrefix" removes the '_bold.nii(.gz)' or '_physio'
+    suffixes only from the end of the prefix
+    """
+    physdata = PhysioData()
+    for suffix in ['', '_bold', '_bold.nii', '_bold.nii.gz', '.nii.gz', '_physio', '_physio.gz']:
+        physdata.set_bidsPrefix('sub-01_bold_task-rest' + suffix)
+        assert physdata.bidsPrefix == 'sub-01_bold_task-rest'
+
+
 def test_save_bids_json(
         tmpdir,
         myphysiodata
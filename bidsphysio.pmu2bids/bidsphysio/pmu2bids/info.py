@@ -25,6 +25,7 @@ PYTHON_REQUIRES = ">=3.6"
 
 REQUIRES = [
     'bidsphysio.base >= 1.3.1',
+    'numpy >= 1.17.1',
 ]
 
 TESTS_REQUIRES = [
@@ -33,6 +34,7 @@ TESTS_REQUIRES = [
 
 EXTRA_REQUIRES = {
     'tests': TESTS_REQUIRES,
+    'numba': ['numba'],
 }
 
 # Flatten the lists
@@ -52,14 +52,46 @@ SOFTWARE.
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import math
+import mmap
 import os
 import re
 import sys
 
+import numpy as np
+
 from bidsphysio.base.bidsphysio import (PhysioSignal,
                                         PhysioData)
 
+# numba is optional. If available, we use it to compile the kernel that
+#   post-processes the raw PMU signal:
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Regular expressions used to parse the PMU files (compiled only once):
+# Information regions in the first line of the file are bound by "5002" and "6002":
+# (The files are parsed as bytes, so that we don't need to decode the signal)
+_SPLIT_RE = re.compile(rb'5002(.*?)6002')
+# Type of physiological recording:
+_LOGVER_RE = re.compile(rb'LOGVERSION_([A-Z]*)')
+_VBX_LOGGING_RE = re.compile(rb'Logging ([A-Z]*) signal')
+# Sampling rate (VBX):
+_VBX_SAMPLES_PER_SECOND_RE = re.compile(rb'_SAMPLES_PER_SECOND = ([0-9]*)')
+# Start and stop logging times:
+_MDH_START_RE = re.compile(r'LogStartMDHTime:?\s+([0-9]+)')
+_MDH_STOP_RE = re.compile(r'LogStopMDHTime:?\s+([0-9]+)')
+_MPCU_START_RE = re.compile(r'LogStartMPCUTime:?\s+([0-9]+)')
+_MPCU_STOP_RE = re.compile(r'LogStopMPCUTime:?\s+([0-9]+)')
+
+# According to Siemens (IDEA documentation), the sampling rate (in samples/s) is
+#   fixed for all signals for these versions:
+_VE11C_SAMPLING_RATE = 400    # 1000/2.5 (2.5ms)
+_VB15A_SAMPLING_RATE = 50
+
 
 def errmsg(msg, pmuFile, expStr=None, gotStr=None):
     msg = msg.replace('%r', repr(pmuFile))
@@ -82,14 +114,14 @@ class PMUFormatError(ValueError):
         ValueError.__init__(self, errmsg(msg, pmuFile, expStr, gotStr))
         self.msg = msg
         self.pmuFile = pmuFile
-        self.mystr = expStr
+        self.expStr = expStr
         self.gotStr = gotStr
 
     def __reduce__(self):
         return self.__class__, (self.msg, self.pmuFile, self.expStr, self.gotStr)
 
 
-def pmu2bids(physio_files, verbose=False):
+def pmu2bids(physio_files, verbose=False, jobs=1):
     """
     Function to read a list of Siemens PMU physio files and
     save them as a BIDS physiological recording.
@@ -100,6 +132,8 @@ def pmu2bids(physio_files, verbose=False):
         list of paths to files with a Siemens PMU recording
     verbose : bool
         verbose flag
+    jobs : int
+        number of files to read in parallel (in separate processes)
 
     Returns
     -------
@@ -111,13 +145,19 @@ def pmu2bids(physio_files, verbose=False):
     if isinstance(physio_files, str):
         physio_files = [physio_files]
 
-    # Init PhysioData object to hold physio signals:
-    physio = PhysioData()
+    # Read the files from the list. The files are independent from each
+    #   other, so if requested, read them in parallel:
+    if jobs > 1 and len(physio_files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pmu_recordings = list(executor.map(partial(readpmu, verbose=verbose), physio_files))
+    else:
+        pmu_recordings = [readpmu(f, verbose=verbose) for f in physio_files]
 
-    # Read the files from the list, extract the relevant information and
-    #   add a new PhysioSignal to the list:
-    for f in physio_files:
-        physio_type, MDHTime, sampling_rate, physio_signal = readpmu(f, verbose=verbose)
+    # We know how many signals we'll have, so allocate the list to hold them:
+    physio_signals = [None] * len(pmu_recordings)
+
+    # Extract the relevant information and add a new PhysioSignal to the list:
+    for idx, (physio_type, MDHTime, sampling_rate, physio_signal) in enumerate(pmu_recordings):
 
         testSamplingRate(
                             sampling_rate = sampling_rate,
@@ -138,20 +178,21 @@ def pmu2bids(physio_files, verbose=False):
         else:
             physio_label = physio_type
 
-        physio.append_signal(
-            PhysioSignal(
-                label=physio_label,
-                units='',
-                samples_per_second=sampling_rate,
-                physiostarttime=MDHTime[0],
-                signal=physio_signal
-            )
+        physio_signals[idx] = PhysioSignal(
+            label=physio_label,
+            units='',
+            samples_per_second=sampling_rate,
+            physiostarttime=MDHTime[0],
+            signal=physio_signal
         )
 
+    # PhysioData object to hold the physio signals:
+    physio = PhysioData(signals=physio_signals)
+
     return physio
 
 
-def readpmu(physio_file, softwareVersion=None, verbose=False):
+def readpmu(physio_file, softwareVersion=None, verbose=False, read_timing=True):
     """
     Function to read the physiological signal from a Siemens PMU physio file
     It would try to open the knew formats (currently, VB15A, VE11C)
@@ -165,6 +206,9 @@ def readpmu(physio_file, softwareVersion=None, verbose=False):
         If None (default behavior), it will try all known versions
     verbose : bool
         Verbose flag
+    read_timing : bool
+        flag indicating whether to read the recording start and stop times
+        (if False, MDHTime will be [0, 0])
 
     Returns
     -------
@@ -176,7 +220,7 @@ def readpmu(physio_file, softwareVersion=None, verbose=False):
         MDHTime[1] gives the end   of the recording
     sampling_rate : int
         number of samples per second
-    physio_signal : list of int
+    physio_signal : np.ndarray
         signal proper. NaN indicate points for which there was no recording
         (the scanner found a trigger in the signal)
     """
@@ -189,7 +233,7 @@ def readpmu(physio_file, softwareVersion=None, verbose=False):
             # (if None, we'll try all knownVersions)
             softwareVersion is None
            ):
-        raise Exception("{sv} is not a known software version.".format(sv=softwareVersion))
+        raise ValueError("{sv} is not a known software version.".format(sv=softwareVersion))
 
     # Define what versions we need to test:
     versionsToTest = [softwareVersion] if softwareVersion else knownVersions
@@ -200,11 +244,11 @@ def readpmu(physio_file, softwareVersion=None, verbose=False):
         # If unsuccessful, it will print a warning and try the next versionToTest
         try:
             if sv == 'VE11C':
-                return readVE11Cpmu(physio_file)
+                return readVE11Cpmu(physio_file, read_timing=read_timing)
             elif sv == 'VB15A':
-                return readVB15Apmu(physio_file)
+                return readVB15Apmu(physio_file, read_timing=read_timing)
             elif sv == 'VBX':
-                return readVBXpmu(physio_file)
+                return readVBXpmu(physio_file, read_timing=read_timing)
         except UnicodeDecodeError as e:
             # not an ascii file, so it's not a valid PMU file:
             raise PMUFormatError(
@@ -230,7 +274,7 @@ def readpmu(physio_file, softwareVersion=None, verbose=False):
         )
 
 
-def readVE11Cpmu(physio_file, forceRead=False):
+def readVE11Cpmu(physio_file, forceRead=False, read_timing=True):
     """
     Function to read the physiological signal from a VE11C Siemens PMU physio file
 
@@ -240,6 +284,9 @@ def readVE11Cpmu(physio_file, forceRead=False):
         path to a file with a Siemens PMU recording
     forceRead : bool
         flag indicating to read the file whether the format seems correct or not
+    read_timing : bool
+        flag indicating whether to read the recording start and stop times
+        (if False, MDHTime will be [0, 0])
 
     Returns
     -------
@@ -251,63 +298,92 @@ def readVE11Cpmu(physio_file, forceRead=False):
         MDHTime[1] gives the end   of the recording
     sampling_rate : int
         number of samples per second
-    physio_signal : list of int
+    physio_signal : np.ndarray
         signal proper. NaN indicate points for which there was no recording
         (the scanner found a trigger in the signal)
     """
 
-    # Read the file, splitting by lines and removing the "newline" (and any blank space)
-    #   at the end of the line:
-    lines = [line.rstrip() for line in open(physio_file)]
-
-    # According to Siemens (IDEA documentation), the sampling rate is 2.5ms for all signals:
-    sampling_rate = int(400)    # 1000/2.5
+    # The sampling rate is the same for all signals:
+    sampling_rate = _VE11C_SAMPLING_RATE
 
-    # For that first line, different information regions are bound by "5002 and "6002".
-    #   Find them:
-    s = re.split('5002(.*?)6002', lines[0])
-    if len(s) == 1:
-        # we failed to find even one "5002 ... 6002" group.
-        raise PMUFormatError(
-                  'File %r does not seem to be a valid VE11C PMU file',
-                  physio_file,
-                  '5002(.*?)6002',
-                  s[0]
-              )
+    # Map the file into memory, rather than reading it. The first line contains the
+    #   signal (which is the bulk of the file), so this way we only copy the parts
+    #   of the file that we need:
+    with open(physio_file, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # (empty file)
+            raise PMUFormatError(
+                      'File %r does not seem to be a valid VE11C PMU file',
+                      physio_file
+                  )
 
-    # The first group contains the triggering method, gate open and close times, etc for
-    #   compatibility with previous versions. Ignore it.
-    # The second group tells us the type of signal ('RESP', 'PULS', etc.)
-    try:
-        physio_type = re.search('LOGVERSION_([A-Z]*)', s[1]).group(1)
-    except AttributeError:
-        print('Could not find type of recording for ' + physio_file)
-        if not forceRead:
+    with mm:
+        first_nl = mm.find(b'\n')
+        if first_nl == -1:
+            first_nl = len(mm)
+
+        # For that first line, different information regions are bound by "5002 and "6002".
+        #   Find them (start, end and contents of each region):
+        regions = [
+            (m.start(), m.end(), m.group(1)) for m in _SPLIT_RE.finditer(mm, 0, first_nl)
+        ]
+        if not regions:
+            # we failed to find even one "5002 ... 6002" group.
             raise PMUFormatError(
                       'File %r does not seem to be a valid VE11C PMU file',
                       physio_file,
-                      'LOGVERSION_([A-Z]*)',
-                      s[1]
+                      '5002(.*?)6002',
+                      mm[:min(first_nl, 80)].decode('ascii', errors='replace')
                   )
-        else:
-            print('Setting recording type to "Unknown"')
-            physio_type = "Unknown"
-            # (continue reading the file)
 
+        # The first group contains the triggering method, gate open and close times, etc for
+        #   compatibility with previous versions. Ignore it.
+        # The second group tells us the type of signal ('RESP', 'PULS', etc.)
+        try:
+            physio_type = _LOGVER_RE.search(regions[0][2]).group(1).decode('ascii')
+        except AttributeError:
+            print('Could not find type of recording for ' + physio_file)
+            if not forceRead:
+                raise PMUFormatError(
+                          'File %r does not seem to be a valid VE11C PMU file',
+                          physio_file,
+                          'LOGVERSION_([A-Z]*)',
+                          regions[0][2].decode('ascii', errors='replace')
+                      )
+            else:
+                print('Setting recording type to "Unknown"')
+                physio_type = "Unknown"
+                # (continue reading the file)
+
+        # The third and fouth groups we ignore, and the fifth (what follows the second
+        #   "5002 ... 6002" region) gives us the physio signal itself.
+        if len(regions) < 2:
+            # we failed to find the second "5002 ... 6002" group.
+            raise PMUFormatError(
+                      'File %r does not seem to be a valid VE11C PMU file',
+                      physio_file,
+                      '5002(.*?)6002 (x2)',
+                      mm[regions[0][1]:min(first_nl, regions[0][1] + 80)].decode('ascii', errors='replace')
+                  )
+        signal_end = regions[2][0] if len(regions) > 2 else first_nl
+        # (remove the "newline" and any blank space at the end, like for the rest of the line)
+        raw_signal = mm[regions[1][1]:signal_end].strip()
 
-    # The third and fouth groups we ignore, and the fifth gives us the physio signal itself.
-    raw_signal = s[4].split(' ')
+        # The rest of the lines have statistics about the signals, plus start and finish times:
+        tail = mm[first_nl+1:].decode('ascii', errors='replace') if read_timing else ''
 
+    # (We pass the signal as a single string, so that the parsing is done by numpy):
     physio_signal = parserawPMUsignal(raw_signal)
 
-    # The rest of the lines have statistics about the signals, plus start and finish times.
     # Get timing:
-    MPCUTime, MDHTime = getPMUtiming(lines[1:])
+    MPCUTime, MDHTime = getPMUtiming(tail) if read_timing else ([0, 0], [0, 0])
 
     return physio_type, MDHTime, sampling_rate, physio_signal
 
 
-def readVB15Apmu(physio_file, forceRead=False):
+def readVB15Apmu(physio_file, forceRead=False, read_timing=True):
     """
     Function to read the physiological signal from a VB15A Siemens PMU physio file
     (e.g.: https://github.com/gitpan/App-AFNI-SiemensPhysio/blob/master/data/wpc4951_10824_20111108_110811.puls)
@@ -320,6 +396,9 @@ def readVB15Apmu(physio_file, forceRead=False):
         path to a file with a Siemens PMU recording
     forceRead : bool
         flag indicating to read the file whether the format seems correct or not
+    read_timing : bool
+        flag indicating whether to read the recording start and stop times
+        (if False, MDHTime will be [0, 0])
 
     Returns
     -------
@@ -331,21 +410,23 @@ def readVB15Apmu(physio_file, forceRead=False):
         MDHTime[1] gives the end   of the recording
     sampling_rate : int
         number of samples per second
-    physio_signal : list of int
+    physio_signal : np.ndarray
         signal proper. NaN indicate points for which there was no recording
         (the scanner found a trigger in the signal)
     """
 
-    # Read the file, splitting by lines and removing the "newline" (and any blank space)
-    #   at the end of the line:
-    lines = [line.rstrip() for line in open(physio_file)]
+    # Read the first line (removing the "newline" and any blank space at the end), which
+    #   contains the signal, and the rest of the file:
+    with open(physio_file) as f:
+        first_line = f.readline().rstrip()
+        tail = f.read() if read_timing else ''
 
     # The first line starts with four integers with info about the recording, followed
     #   by the data. So split by spaces:
-    line0 = lines[0].split()
+    line0 = first_line.split()
     try:
         recInfo = [int(v) for v in line0[:4]]
-    except:
+    except ValueError:
         raise PMUFormatError(
                   'File %r does not seem to be a valid VB15A PMU file',
                   physio_file,
@@ -355,8 +436,8 @@ def readVB15Apmu(physio_file, forceRead=False):
 
     raw_signal = line0[4:]     # we'll transform the signal to int later
 
-    # According to Siemens (IDEA documentation), the sampling rate is 50 samples/s for all signals:
-    sampling_rate = int(50)
+    # The sampling rate is the same for all signals:
+    sampling_rate = _VB15A_SAMPLING_RATE
 
     # Check the recording. These are fixed:
     physio_type = None
@@ -388,12 +469,12 @@ def readVB15Apmu(physio_file, forceRead=False):
 
     # The rest of the lines have statistics about the signals, plus start and finish times.
     # Get timing:
-    MPCUTime, MDHTime = getPMUtiming(lines[1:])
+    MPCUTime, MDHTime = getPMUtiming(tail) if read_timing else ([0, 0], [0, 0])
 
     return physio_type, MDHTime, sampling_rate, physio_signal
 
 
-def readVBXpmu(physio_file, forceRead=False):
+def readVBXpmu(physio_file, forceRead=False, read_timing=True):
     """
     Function to read the physiological signal from some VB Siemens PMU physio file
     (Possibly VB17? or VB19?)
@@ -406,6 +487,9 @@ def readVBXpmu(physio_file, forceRead=False):
         path to a file with a Siemens PMU recording
     forceRead : bool
         flag indicating to read the file whether the format seems correct or not
+    read_timing : bool
+        flag indicating whether to read the recording start and stop times
+        (if False, MDHTime will be [0, 0])
 
     Returns
     -------
@@ -417,32 +501,37 @@ def readVBXpmu(physio_file, forceRead=False):
         MDHTime[1] gives the end   of the recording
     sampling_rate : int
         number of samples per second
-    physio_signal : list of int
+    physio_signal : np.ndarray
         signal proper. NaN indicate points for which there was no recording
         (the scanner found a trigger in the signal)
     """
 
-    # Read the file, splitting by lines and removing the "newline" (and any blank space)
-    #   at the end of the line:
-    lines = [line.rstrip() for line in open(physio_file)]
+    # Read the file (as bytes). The first line contains the signal, so find where it
+    #   ends and remove the "newline" (and any blank space) at the end of it:
+    with open(physio_file, 'rb') as f:
+        buf = f.read()
+    first_nl = buf.find(b'\n')
+    if first_nl == -1:
+        first_nl = len(buf)
+    header = buf[:first_nl].rstrip()
 
     # For that first line, different information regions are bound by "5002 and "6002".
     #   Find them:
-    s = re.split('5002(.*?)6002', lines[0])
+    s = _SPLIT_RE.split(header)
     if len(s) == 1:
         # we failed to find even one "5002 ... 6002" group.
         raise PMUFormatError(
                   'File %r does not seem to be a valid VBX PMU file',
                   physio_file,
                   '5002(.*?)6002',
-                  s[0]
+                  s[0].decode('ascii', errors='replace')
               )
 
     # The first group contains the triggering method, gate open and close times, etc for
     #   compatibility with previous versions. Ignore it.
     # The second group tells us the type of signal ('RESP', 'PULS', etc.)
     try:
-        physio_type = re.search('Logging ([A-Z]*) signal', s[1]).group(1)
+        physio_type = _VBX_LOGGING_RE.search(s[1]).group(1).decode('ascii')
     except AttributeError:
         print('Could not find type of recording for ' + physio_file)
         if not forceRead:
@@ -450,7 +539,7 @@ def readVBXpmu(physio_file, forceRead=False):
                       'File %r does not seem to be a valid VBX PMU file',
                       physio_file,
                       'Logging ([A-Z]*) signal',
-                      s[1]
+                      s[1].decode('ascii', errors='replace')
                   )
         else:
             print('Setting recording type to "Unknown"')
@@ -459,24 +548,26 @@ def readVBXpmu(physio_file, forceRead=False):
 
     # Also, the sampling rate:
     try:
-        sampling_rate = int(re.search('_SAMPLES_PER_SECOND = ([0-9]*)', s[1]).group(1))
+        sampling_rate = int(_VBX_SAMPLES_PER_SECOND_RE.search(s[1]).group(1))
     except AttributeError:
         print('Could not find the sampling rate for ' + physio_file)
         raise PMUFormatError(
                   'File %r does not seem to be a valid VBX PMU file',
                   physio_file,
                   '_SAMPLES_PER_SECOND = ([0-9]*)',
-                  s[1]
+                  s[1].decode('ascii', errors='replace')
               )
 
     # The third group gives us the physio signal itself.
-    raw_signal = s[2].split(' ')
-
-    physio_signal = parserawPMUsignal(raw_signal)
+    # (We pass it as a single string, so that the parsing is done by numpy):
+    physio_signal = parserawPMUsignal(s[2])
 
     # The rest of the lines have statistics about the signals, plus start and finish times.
     # Get timing:
-    MPCUTime, MDHTime = getPMUtiming(lines[1:])
+    MPCUTime, MDHTime = (
+        getPMUtiming(buf[first_nl+1:].decode('ascii', errors='replace')) if read_timing
+        else ([0, 0], [0, 0])
+    )
 
     return physio_type, MDHTime, sampling_rate, physio_signal
 
@@ -487,8 +578,8 @@ def getPMUtiming(lines):
 
     Parameters
     ----------
-    lines : list of str
-        list with PMU file lines
+    lines : str or list of str
+        PMU file lines (either as a single string or as a list of lines)
         To improve speed, don't pass the first line, which contains the raw data.
 
     Returns
@@ -502,21 +593,17 @@ def getPMUtiming(lines):
 
     """
 
-    MPCUTime = [0,0]
-    MDHTime = [0,0]
-    for l in lines:
-        if 'MPCUTime' in l:
-            ls = l.split()
-            if 'LogStart' in l:
-                MPCUTime[0]= int(ls[1])
-            elif 'LogStop' in l:
-                MPCUTime[1]= int(ls[1])
-        if 'MDHTime' in l:
-            ls = l.split()
-            if 'LogStart' in l:
-                MDHTime[0]= int(ls[1])
-            elif 'LogStop' in l:
-                MDHTime[1]= int(ls[1])
+    if not isinstance(lines, str):
+        lines = '\n'.join(lines)
+
+    # Search for each of the timestamps (0 if not found). If one is repeated,
+    #   keep the last one:
+    timestamps = []
+    for regex in [_MPCU_START_RE, _MPCU_STOP_RE, _MDH_START_RE, _MDH_STOP_RE]:
+        matches = regex.findall(lines)
+        timestamps.append(int(matches[-1]) if matches else 0)
+    MPCUTime = timestamps[:2]
+    MDHTime = timestamps[2:]
 
     return MPCUTime, MDHTime
 
@@ -527,36 +614,95 @@ def parserawPMUsignal(signal):
 
     Parameters
     ----------
-    signal : list of str
-        list with raw PMU signal
+    signal : str, bytes or list of str
+        raw PMU signal, either as a string of space-separated values
+        or as a list with the individual values
 
     Returns
     -------
-    signal : list of int
+    signal : np.ndarray
         parsed signal. NaN indicate points for which there was no recording
         (the scanner found a trigger in the signal)
     """
 
-    # Sometimes, there is an empty string ('') at the beginning of the string. Remove it:
-    if signal[0] == '':
-        signal = signal[1:]
+    if isinstance(signal, (str, bytes)):
+        # Convert to integers (numpy parses the whole string at once).
+        # (Strip it first: numpy would parse a blank string as a single 0)
+        signal = np.fromstring(signal.strip(), dtype=np.int64, sep=' ')
+    else:
+        # Sometimes, there is an empty string ('') at the beginning of the string. Remove it:
+        if signal[0] == '':
+            signal = signal[1:]
 
-    # Convert to integers:
-    signal = [int(v) for v in signal]
+        # Convert to integers:
+        signal = np.array(signal, dtype=np.int64)
 
-    # only keep up to "5003" (indicates end of signal recording):
-    try:
-        signal = signal[:signal.index(5003)]
-    except ValueError:
+    # Keep only the signal proper and mask the triggers:
+    signal, found_end = _mask_triggers(signal)
+    if not found_end:
         print("Warning: End of physio recording not found. Keeping whole data")
 
+    return signal
+
+
+def _mask_triggers_numpy(signal):
+    """
+    Function to post-process the raw (integer) PMU signal with numpy.
+
+    Parameters
+    ----------
+    signal : np.ndarray of int
+        raw PMU signal
+
+    Returns
+    -------
+    signal : np.ndarray of float32
+        signal up to the "5003" code, with NaN where there was a trigger
+    found_end : bool
+        whether the "5003" code was found
+    """
+
+    # only keep up to "5003" (indicates end of signal recording):
+    # (flatnonzero returns an empty array if it is not found)
+    end = np.flatnonzero(signal == 5003)
+    found_end = bool(end.size)
+    if found_end:
+        signal = signal[:end[0]]
+
     # Values "5000" and "6000" indicate "trigger on" and "trigger off", respectively, so they
     #   are not a real physio_signal value. So replace them with NaN:
-    for idx, v in enumerate(signal):
-        if v == 5000 or v == 6000:
-            signal[idx] = float('NaN')
+    # (The values are integer ADC readings, so float32 represents them exactly
+    #   and takes half the memory of float64)
+    trigger_mask = (signal == 5000) | (signal == 6000)
+    signal = signal.astype(np.float32, copy=True)
+    signal[trigger_mask] = np.nan
 
-    return signal
+    return signal, found_end
+
+
+def _mask_triggers_loop(signal):
+    """
+    Same as _mask_triggers_numpy, but in a single pass through the signal.
+    It is only fast when compiled with numba.
+    """
+
+    out = np.empty(signal.shape[0], dtype=np.float32)
+    for i in range(signal.shape[0]):
+        if signal[i] == 5003:
+            return out[:i], True
+        elif signal[i] == 5000 or signal[i] == 6000:
+            out[i] = np.nan
+        else:
+            out[i] = signal[i]
+
+    # (slice it anyway, so that numba sees the same return type as above)
+    return out[:], False
+
+
+if numba is not None:
+    _mask_triggers = numba.njit(cache=True)(_mask_triggers_loop)
+else:
+    _mask_triggers = _mask_triggers_numpy
 
 
 def testSamplingRate(
@@ -605,6 +751,7 @@ def main():
     parser.add_argument('-i', '--infiles', nargs='+', required=True, help='.puls or .resp physio file(s)')
     parser.add_argument('-b', '--bidsprefix', required=True, help='Prefix of the BIDS file. It should match the _bold.nii.gz')
     parser.add_argument('-v', '--verbose', action="store_true", default=False, help='verbose screen output')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of physio files to read in parallel')
     args = parser.parse_args()
 
     # make sure input files exist:
@@ -617,7 +764,7 @@ def main():
     if not os.path.exists(odir):
         os.makedirs(odir)
 
-    physio_data = pmu2bids(args.infiles, verbose=args.verbose)
+    physio_data = pmu2bids(args.infiles, verbose=args.verbose, jobs=args.jobs)
     if physio_data.labels():
         physio_data.save_to_bids_with_trigger(args.bidsprefix)
 
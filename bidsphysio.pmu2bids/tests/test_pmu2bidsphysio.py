@@ -3,8 +3,10 @@
 import gzip
 import json
 from pathlib import Path
+import pickle
 import sys
 
+import numpy as np
 import pytest
 
 from bidsphysio.pmu2bids import pmu2bidsphysio as p2bp
@@ -100,6 +102,9 @@ def test_PMUFormatError_class(myErrmsg):
         raise myError
     assert str(err_info.value) == myErrmsg
 
+    # It can be pickled (e.g., to send it back from a worker process):
+    assert str(pickle.loads(pickle.dumps(myError))) == myErrmsg
+
 
 def test_parserawPMUsignal(capfd):
     """
@@ -112,15 +117,63 @@ def test_parserawPMUsignal(capfd):
     assert capfd.readouterr().out.startswith('Warning: End of physio recording not found')
     assert float('NaN') not in psignal
     # make sure it returns all the values, except for the first empty one:
-    assert psignal == [int(i) for i in raw_signal[1:]]
+    assert list(psignal) == [int(i) for i in raw_signal[1:]]
+
+    # 2) the same signal, as a single string, gives the same result:
+    assert list(p2bp.parserawPMUsignal(' '.join(raw_signal))) == list(psignal)
 
-    # 2) simulated raw signal with '5003' and with '5000' and '6000', to indicate "trigger on" and "trigger off":
+    # 3) simulated raw signal with '5003' and with '5000' and '6000', to indicate "trigger on" and "trigger off":
     raw_signal = ['1733', '5000', '1725', '6000', '1721', '5003', '1718']
     psignal = p2bp.parserawPMUsignal(raw_signal)
     assert 5000 not in psignal
     assert 6000 not in psignal
     assert psignal == pytest.approx([1733, float('NaN'), 1725, float('NaN'), 1721], nan_ok=True)
 
+    # 4) a blank string (or bytes) gives an empty signal:
+    for blank in [' ', b' ', b'\r']:
+        assert p2bp.parserawPMUsignal(blank).size == 0
+
+
+# raw signals to test the post-processing of the raw PMU signal:
+RAW_SIGNALS = [
+    np.array([1733, 1725, 1725, 1721, 1721, 1718]),
+    np.array([1733, 5000, 1725, 6000, 1721, 5003, 1718]),
+    np.array([], dtype=np.int64),
+]
+
+
+def check_mask_triggers(mask_triggers):
+    """
+    Checks that "mask_triggers" gives the same results as the numpy
+    implementation of the raw signal post-processing
+    """
+    for raw_signal in RAW_SIGNALS:
+        np_signal, np_found_end = p2bp._mask_triggers_numpy(raw_signal)
+        signal, found_end = mask_triggers(raw_signal)
+        assert np_found_end == found_end
+        assert np_signal.dtype == signal.dtype
+        np.testing.assert_array_equal(np_signal, signal)
+
+
+def test_mask_triggers():
+    """
+    Tests that the numpy and the single-pass implementations of the
+    raw signal post-processing give the same results, as well as the
+    one actually used by parserawPMUsignal
+    """
+    check_mask_triggers(p2bp._mask_triggers_loop)
+    check_mask_triggers(p2bp._mask_triggers)
+
+
+def test_mask_triggers_numba():
+    """
+    If numba is installed, test that the compiled kernel is used and that
+    it gives the same results as the numpy implementation
+    """
+    pytest.importorskip('numba')
+    assert p2bp._mask_triggers is not p2bp._mask_triggers_numpy
+    check_mask_triggers(p2bp._mask_triggers)
+
 
 def test_getPMUtiming():
     """
@@ -131,7 +184,7 @@ def test_getPMUtiming():
     # 1) If the keywords are missing, the outputs should be 0
     assert p2bp.getPMUtiming([]) == ([0, 0], [0, 0])
 
-    # 1) If the keywords are present, we should get them back (as int)
+    # 2) If the keywords are present, we should get them back (as int)
     LogStartMPCUTime = 39009937
     LogStopMPCUTime = 39019125
 
@@ -148,8 +201,20 @@ def test_getPMUtiming():
         [STARTMDHTIME, STOPMDHTIME]
     )
 
+    # 3) Same thing if the lines are passed as a single string:
+    assert p2bp.getPMUtiming('\n'.join(lines)) == (
+        [LogStartMPCUTime, LogStopMPCUTime],
+        [STARTMDHTIME, STOPMDHTIME]
+    )
+
+    # 4) If a timestamp is repeated, we get the last one:
+    assert p2bp.getPMUtiming(['LogStartMDHTime:  5', 'LogStartMDHTime:  7']) == (
+        [0, 0],
+        [7, 0]
+    )
+
 
-def test_readVE11Cpmu():
+def test_readVE11Cpmu(tmpdir):
     """
     Tests for readVE11Cpmu
     """
@@ -176,6 +241,21 @@ def test_readVE11Cpmu():
         for expected_line, returned_signal in zip(expected, physio_signal):
             assert float(expected_line) == returned_signal
 
+    # 3) If we don't need the timing, we get the same results, but no MDHTime:
+    physio_type_nt, MDHTime_nt, sampling_rate_nt, physio_signal_nt = p2bp.readVE11Cpmu(
+        physio_file, read_timing=False
+    )
+    assert MDHTime_nt == [0, 0]
+    assert (physio_type_nt, sampling_rate_nt) == (physio_type, sampling_rate)
+    np.testing.assert_array_equal(physio_signal_nt, physio_signal)
+
+    # 4) A file with a blank signal gives an empty signal:
+    blank_file = tmpdir / 'blank_VE11C.resp'
+    blank_file.write_binary(b'1 2 40 280 5002 LOGVERSION_RESP 6002 5002 x 6002 \r\n')
+    physio_type, MDHTime, sampling_rate, physio_signal = p2bp.readVE11Cpmu(str(blank_file))
+    assert physio_type == 'RESP'
+    assert physio_signal.size == 0
+
 
 def test_readVB15Apmu():
     """
@@ -314,7 +394,7 @@ def test_readpmu_with_incorrect_file():
     physio_file = str(TESTS_DATA_PATH / PMUVBXFILE)
 
     # 1) If you call it with an unknown PMU software version, raise an error:
-    with pytest.raises(Exception) as err_info:
+    with pytest.raises(ValueError) as err_info:
         p2bp.readpmu(physio_file, 'Vfoo')
     assert str(err_info.value) == "Vfoo is not a known software version."
 
@@ -401,3 +481,20 @@ def test_pmu2bids(
     check_bidsphysio_outputs(outbids,
                              [['cardiac'], ['respiratory']],
                              TESTS_DATA_PATH / 'pmu_VE11C_')
+
+
+def test_pmu2bids_parallel():
+    """
+    Tests that reading the files in parallel with "pmu2bids" gives the
+    same results as reading them one by one
+    """
+    infile1 = str(TESTS_DATA_PATH / PMUVE11CFILE)
+    infile2 = infile1[:-5] + '.resp'
+
+    serial = p2bp.pmu2bids([infile1, infile2])
+    parallel = p2bp.pmu2bids([infile1, infile2], jobs=2)
+
+    assert parallel.labels() == serial.labels()
+    for p_signal, s_signal in zip(parallel.signals, serial.signals):
+        assert p_signal.physiostarttime == s_signal.physiostarttime
+        np.testing.assert_array_equal(p_signal.signal, s_signal.signal)